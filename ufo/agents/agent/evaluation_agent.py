@@ -1,8 +1,9 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 
-
-from typing import Any, Dict, Optional, Tuple
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ufo.agents.agent.basic import BasicAgent
 from ufo.agents.states.evaluaton_agent_state import EvaluatonAgentStatus
@@ -44,6 +45,7 @@ class EvaluationAgent(BasicAgent):
             api_prompt,
             app_root_name,
         )
+        self._system_prompt: Optional[str] = None
 
     def get_prompter(
         self,
@@ -76,7 +78,7 @@ class EvaluationAgent(BasicAgent):
         :return: The message.
         """
 
-        evaagent_prompt_system_message = self.prompter.system_prompt_construction()
+        evaagent_prompt_system_message = self.system_prompt
 
         evaagent_prompt_user_message = self.prompter.user_content_construction(
             log_path=log_path, request=request, eva_all_screenshots=eva_all_screenshots
@@ -88,6 +90,20 @@ class EvaluationAgent(BasicAgent):
 
         return evaagent_prompt_message
 
+    @property
+    def system_prompt(self) -> str:
+        """
+        Get the system prompt. It is constructed once and cached, as it only depends on the
+        prompt templates and on the EVA_ALL_SCREENSHOTS and USE_APIS configs. Changing those
+        configs at runtime will not refresh the cached prompt.
+        :return: The system prompt.
+        """
+
+        if self._system_prompt is None:
+            self._system_prompt = self.prompter.system_prompt_construction()
+
+        return self._system_prompt
+
     @property
     def status_manager(self) -> EvaluatonAgentStatus:
         """
@@ -116,6 +132,95 @@ class EvaluationAgent(BasicAgent):
 
         return result, cost
 
+    async def aevaluate(
+        self, request: str, log_path: str, eva_all_screenshots: bool = True
+    ) -> Tuple[Dict[str, str], float]:
+        """
+        Evaluate the task completion without blocking the event loop, so that several
+        evaluations can be awaited concurrently.
+        :param request: The request to evaluate.
+        :param log_path: The path to the log file.
+        :param eva_all_screenshots: The flag indicating whether to evaluate all screenshots.
+        :return: The evaluation result and the cost of LLM.
+        """
+
+        return await asyncio.to_thread(
+            self.evaluate,
+            request=request,
+            log_path=log_path,
+            eva_all_screenshots=eva_all_screenshots,
+        )
+
+    def evaluate_batch(
+        self,
+        requests: List[Tuple[str, str]],
+        eva_all_screenshots: bool = True,
+        max_workers: int = 4,
+    ) -> List[Union[Tuple[Dict[str, str], float], Exception]]:
+        """
+        Evaluate multiple tasks concurrently with the same agent. As in the session evaluation,
+        a task that fails with all screenshots is retried with the head and tail screenshots
+        only. A task that still fails does not abort the batch: its exception is returned in
+        its place, so the results and costs of the other tasks are kept.
+        :param requests: The list of (request, log_path) pairs to evaluate.
+        :param eva_all_screenshots: The flag indicating whether to evaluate all screenshots.
+        :param max_workers: The maximum number of evaluations in flight.
+        :return: The evaluation result and the cost of LLM, or the exception raised, for each
+        request in the order of the requests.
+        """
+
+        if not requests:
+            return []
+
+        max_workers = max(1, min(max_workers, len(requests)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._evaluate_with_fallback,
+                    request=request,
+                    log_path=log_path,
+                    eva_all_screenshots=eva_all_screenshots,
+                )
+                for request, log_path in requests
+            ]
+
+        results = []
+
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+
+        return results
+
+    def _evaluate_with_fallback(
+        self, request: str, log_path: str, eva_all_screenshots: bool = True
+    ) -> Tuple[Dict[str, str], float]:
+        """
+        Evaluate the task completion, falling back to the head and tail screenshots if the
+        evaluation with all screenshots fails.
+        :param request: The request to evaluate.
+        :param log_path: The path to the log file.
+        :param eva_all_screenshots: The flag indicating whether to evaluate all screenshots.
+        :return: The evaluation result and the cost of LLM.
+        """
+
+        try:
+            return self.evaluate(
+                request=request,
+                log_path=log_path,
+                eva_all_screenshots=eva_all_screenshots,
+            )
+        except Exception:
+            if not eva_all_screenshots:
+                raise
+
+            return self.evaluate(
+                request=request, log_path=log_path, eva_all_screenshots=False
+            )
+
     def process_comfirmation(self) -> None:
         """
         Comfirmation, currently do nothing.
@@ -153,7 +258,7 @@ class EvaluationAgent(BasicAgent):
             "[Task is complete💯:] {complete}".format(complete=complete), "cyan"
         )
 
-        print_with_color(f"[Reason🤔:] {reason}".format(reason=reason), "blue")
+        print_with_color(f"[Reason🤔:] {reason}", "blue")
 
 
 # The following code is used for testing the agent.